@@ -6,7 +6,8 @@ What this script does:
 1) Opens a simple file dialog so you can pick a JB4 CSV log file.
 2) JB4 CSVs often contain metadata "blocks" before the actual data table.
    The real data header is the line that starts with "timestamp".
-   We scan the file to find that line and tell pandas to treat it as the header.
+   We scan the file to find that line and skip every line before it when reading
+   the table, so it becomes the header.
 3) Plots selected channels versus time using stacked subplots (sharex=True),
    so zoom/pan on one subplot applies to all subplots.
 4) Adds a synchronized "cursor" (vertical line + markers) that follows your mouse
@@ -21,10 +22,17 @@ Linux venv
 
 Dependencies:
   pip install pandas matplotlib pyqt5
+Optional:
+  pip install pyarrow   (faster CSV loading)
+  pip install numba     (compiles the cursor's nearest-sample search and the
+                         fallback header-line scan to machine code)
 """
 
 from __future__ import annotations
 
+import mmap
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
 # IMPORTANT: Matplotlib "backend" must be selected before importing pyplot.
@@ -32,9 +40,38 @@ from pathlib import Path
 import matplotlib
 matplotlib.use("QtAgg")
 
+# Drawing settings that keep the interactive window responsive with long logs:
+# - agg.path.chunksize: draw very long lines in chunks of this many points instead of
+#   one giant path (avoids long stalls, and Agg errors on huge paths).
+# - path.simplify(_threshold): merge line segments that are closer than ~1 pixel.
+#   Long logs have far more samples than the screen has pixels.
+# - figure.autolayout: off; we lay the figure out once with tight_layout() before
+#   showing it, instead of re-running the layout on every redraw/resize.
+matplotlib.rcParams.update({
+    "agg.path.chunksize": 10000,
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "figure.autolayout": False,
+})
+
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.backend_bases import TimerBase
+
+try:
+    # Optional: reads the CSV much faster than pandas (see read_csv_pyarrow()).
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+try:
+    # Optional: compiles the hot loops (find_header_line() fallback scan and the
+    # cursor's nearest_index()) to machine code.
+    import numba
+except ImportError:
+    numba = None
 
 
 # -----------------------------------------------------------------------------
@@ -63,6 +100,20 @@ PLOTS = [
     ("Speed", "Speed (mph)", (0, 120)),
 ]
 
+# Extra columns that are overlaid on some subplots, keyed by the PLOTS friendly name.
+# Example: the Boost subplot also shows Boost2 and Target.
+OVERLAY_COLUMNS = {
+    "Pedal": ["Throttle"],
+    "RPM": ["GEAR"],
+    "Boost": ["Boost2", "Target"],
+    "AFR": ["AFR2"],
+    "Speed": ["GPS Speed"],
+}
+
+# Channels whose cursor labels are shown as whole numbers ("RPM: 3542").
+# Every other channel is shown with 2 decimals ("Boost: 17.25").
+INTEGER_LABEL_CHANNELS = {"RPM", "IAT", "Speed", "GPS Speed", "Pedal", "Throttle", "GEAR"}
+
 # -----------------------------------------------------------------------------
 # Timestamp fix (manual on/off)
 # -----------------------------------------------------------------------------
@@ -78,6 +129,28 @@ TIMESTAMP_SCALE = 0.1  # multiply timestamps by this (0.1 == divide by 10)
 # Example: 8 * 100 = 800 RPM-equivalent, which is easy to see near the bottom.
 GEAR_SCALE = 100.0  # multiply GEAR by this when overlaying on RPM
 
+# -----------------------------------------------------------------------------
+# Long logs (display decimation)
+# -----------------------------------------------------------------------------
+# Logs with more than DECIMATE_THRESHOLD samples are drawn as a min/max envelope of
+# DECIMATE_BINS bins (see decimate_for_display()). This keeps drawing and zoom/pan
+# responsive for multi-hour logs. The envelope is rebuilt for the visible range on
+# every zoom/pan, so once DECIMATE_THRESHOLD samples or fewer are visible every
+# sample is drawn. Only the drawn lines are reduced: the cursor always snaps to,
+# and shows values from, every sample.
+DECIMATE_THRESHOLD = 50_000
+DECIMATE_BINS = 4000
+
+# -----------------------------------------------------------------------------
+# Cursor label layout
+# -----------------------------------------------------------------------------
+# Overlay value labels (Boost2, Target, Throttle, ...) are stacked vertically in screen
+# space so they remain readable even when the underlying y-values are very close.
+#
+# Offsets are in "points" (1/72 inch). Tune these if you want more/less spacing.
+Y_OFFSETS_BOOST = np.array([14, 0, -14])  # Boost2, Target
+Y_OFFSETS_DEFAULT = np.array([14])        # overlays on every other subplot
+
 
 # -----------------------------------------------------------------------------
 # File picker
@@ -130,20 +203,97 @@ def pick_csv_file(initial_dir: Path) -> Path:
 # -----------------------------------------------------------------------------
 # CSV parsing: skip metadata blocks and start at the header row "timestamp,..."
 # -----------------------------------------------------------------------------
+def _scan_header(buf: np.ndarray, prefix: np.ndarray) -> int:
+    """
+    Return the 0-based index of the first line in buf that starts with prefix
+    (after skipping leading spaces/tabs), or -1 if there is none.
+
+    buf and prefix are uint8 arrays of raw bytes. This is written as a plain byte loop
+    so numba can compile it (when installed); see find_header_line().
+    """
+    n = len(buf)
+    m = len(prefix)
+    line = 0
+    i = 0
+    while i < n:
+        # Skip leading whitespace (space, tab, \v, \f, \r) but stay on this line
+        while i < n and (buf[i] == 32 or 9 <= buf[i] <= 13) and buf[i] != 10:
+            i += 1
+
+        k = 0
+        while k < m and i + k < n and buf[i + k] == prefix[k]:
+            k += 1
+        if k == m:
+            return line
+
+        # Move to the start of the next line
+        while i < n and buf[i] != 10:
+            i += 1
+        i += 1
+        line += 1
+
+    return -1
+
+
+if numba is not None:
+    # cache=True stores the compiled code on disk, so only the first run pays the compile time.
+    _scan_header = numba.njit(cache=True)(_scan_header)
+
+
 def find_header_line(csv_path: Path, header_startswith: str = "timestamp") -> int:
     """
     JB4 logs often start with metadata lines, then the "real" CSV header appears.
 
-    We scan the file (line-by-line) until we find a line whose beginning is:
+    We scan the file until we find a line whose beginning is:
         "timestamp"
 
+    Fast path: memory-map the file and search the raw bytes for "\ntimestamp".
+    This is a single C-level search instead of decoding the file line by line.
+    If that finds nothing (e.g. the header line has leading whitespace), we fall
+    back to a line-by-line scan: compiled with numba when it is installed
+    (see _scan_header()), otherwise in plain Python.
+
     Returns:
-        0-based line index of the header row. This index can be passed to pandas
-        read_csv(..., header=<index>).
+        0-based line index of the header row, counting every line (blank ones too).
+        This index can be passed as pandas read_csv(..., skiprows=<index>) or pyarrow
+        ReadOptions(skip_rows=<index>). Not as pandas header=<index>, which does
+        not count blank lines.
 
     Example:
         If the file's header row is the 5th line in the file, return 4.
     """
+    prefix = header_startswith.encode("utf-8")
+
+    with csv_path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be memory-mapped (and have no header anyway).
+            mm = None
+
+        if mm is not None:
+            with mm:
+                if mm[:len(prefix)] == prefix:
+                    return 0
+
+                pos = mm.find(b"\n" + prefix)
+                if pos != -1:
+                    # Header line index == number of line breaks before it.
+                    return mm[:pos + 1].count(b"\n")
+
+                if numba is not None:
+                    buf = np.frombuffer(mm, dtype=np.uint8)
+                    try:
+                        line = int(_scan_header(buf, np.frombuffer(prefix, dtype=np.uint8)))
+                    except Exception:
+                        # The compiled scan is only a speed-up; if numba fails (e.g. a
+                        # stale on-disk cache) use the plain Python scan below.
+                        line = -1
+                    finally:
+                        del buf  # the mmap cannot be closed while a numpy view of it exists
+                    if line >= 0:
+                        return line
+
     with csv_path.open("r", encoding="utf-8", errors="replace") as f:
         for i, line in enumerate(f):
             # lstrip() removes leading whitespace; helpful if file has odd formatting.
@@ -153,44 +303,148 @@ def find_header_line(csv_path: Path, header_startswith: str = "timestamp") -> in
     raise ValueError(f'Could not find a header line starting with "{header_startswith}" in {csv_path}')
 
 
+# Columns we actually use (names after clean_column_names()). JB4 logs contain many
+# more channels; skipping the rest makes reading large logs much faster.
+READ_COLUMNS = {
+    "timestamp",
+    # Required by resolve_columns()
+    "RPM", "Pedal", "Throttle", "AFR", "IAT",
+    # Alternative names handled by resolve_columns()
+    "Boost", "ECU Boost", "Speed", "GPS Speed",
+    *(friendly_name for friendly_name, _y_label, _y_lim in PLOTS),
+    *(col for overlay_cols in OVERLAY_COLUMNS.values() for col in overlay_cols),
+}
+
+
+def clean_column_names(columns: pd.Index) -> pd.Index:
+    """
+    Some logs have trailing/leading spaces in column names or multiple spaces.
+    Strip whitespace and collapse repeated spaces into one.
+    """
+    return (
+        columns.astype(str)
+        .str.strip()
+        .str.replace(r"\s+", " ", regex=True)
+    )
+
+
+def read_csv_pyarrow(csv_path: Path, header_line: int, usecols: list[str]) -> pd.DataFrame | None:
+    """
+    Read the data table with pyarrow's CSV reader (used by read_jb4_csv() when installed).
+
+    We tell pyarrow the column types up front (timestamp as float64, every channel as
+    float32), so it does not have to guess them. If a column contains text that is not
+    a number, that fails; we then read again letting pyarrow guess, and the numeric
+    conversion in main() turns the text into NaN.
+
+    pyarrow cannot keep rows with the wrong number of fields (e.g. a last line cut off
+    when logging stopped), while pandas keeps short rows with the missing channels as
+    NaN. So that both readers give the same rows, we return None for such files and
+    read_jb4_csv() reads them with pandas instead.
+    """
+    malformed_rows = []
+
+    def on_invalid_row(row) -> str:
+        malformed_rows.append(row.text)
+        return "error"  # stop reading; the file goes to pandas anyway
+
+    read_options = pacsv.ReadOptions(skip_rows=header_line)
+    parse_options = pacsv.ParseOptions(invalid_row_handler=on_invalid_row)
+    column_types = {
+        raw: pa.float64() if clean == "timestamp" else pa.float32()
+        for raw, clean in zip(usecols, clean_column_names(pd.Index(usecols)))
+    }
+
+    try:
+        try:
+            table = pacsv.read_csv(
+                csv_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=pacsv.ConvertOptions(include_columns=usecols, column_types=column_types),
+            )
+        except pa.ArrowInvalid:
+            if malformed_rows:
+                raise
+            table = pacsv.read_csv(
+                csv_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=pacsv.ConvertOptions(include_columns=usecols),
+            )
+    except pa.ArrowInvalid:
+        if malformed_rows:
+            return None
+        raise
+
+    return table.to_pandas(split_blocks=True)
+
+
 def read_jb4_csv(csv_path: Path) -> pd.DataFrame:
     """
     Read a JB4 CSV file into a DataFrame, ignoring metadata lines before the header.
 
     Steps:
     1) Find the header line index (row that begins with "timestamp").
-    2) Read the CSV with pandas, using that row as the header.
-    3) Clean column names (strip whitespace and normalize spacing).
-    4) Convert timestamp to numeric and drop rows that don't parse.
+    2) Read just the header row to see which of the columns we need (READ_COLUMNS) exist.
+    3) Read the CSV, using that row as the header and only those columns.
+       pyarrow's CSV reader is used when installed (much faster), else pandas.
+       Either way, rows with too few fields (e.g. a last line cut off when logging
+       stopped) are kept, with the missing channels as NaN.
+    4) Clean column names (strip whitespace and normalize spacing).
+    5) Convert timestamp to numeric (if the parser did not already) and drop rows
+       that don't parse.
 
     Returns:
         pandas DataFrame where df["timestamp"] is numeric seconds (float).
     """
     header_line = find_header_line(csv_path, header_startswith="timestamp")
 
-    # pandas will treat the specified line as the header row.
-    df = pd.read_csv(csv_path, header=header_line)
+    # Skip the lines before the header so it becomes the first row.
+    # skiprows counts every line, blank ones included, exactly like find_header_line()
+    # and pyarrow's skip_rows (header=header_line would not count blank lines).
+    # nrows=0 reads only the header, so this is cheap even for huge logs.
+    raw_columns = pd.read_csv(csv_path, skiprows=header_line, nrows=0).columns
+    usecols = [
+        raw for raw, clean in zip(raw_columns, clean_column_names(raw_columns))
+        if clean in READ_COLUMNS
+    ]
+    if not usecols:
+        raise ValueError(f"None of the expected columns found in header line {header_line}: {list(raw_columns)}")
 
-    # Some logs have trailing/leading spaces in column names or multiple spaces.
-    df.columns = (
-        df.columns.astype(str)
-        .str.strip()
-        .str.replace(r"\s+", " ", regex=True)
-    )
+    df = None
+    if pacsv is not None:
+        df = read_csv_pyarrow(csv_path, header_line, usecols)
+    if df is None:
+        # pyarrow is optional; pandas gives the same result, just slower.
+        df = pd.read_csv(csv_path, skiprows=header_line, usecols=usecols)
+
+    df.columns = clean_column_names(df.columns)
 
     # Require timestamp column
     if "timestamp" not in df.columns:
         raise ValueError(f'Expected a "timestamp" column, found: {list(df.columns)}')
 
-    # Convert timestamp to numeric; invalid parsing becomes NaN
-    df["timestamp"] = pd.to_numeric(df["timestamp"], errors="coerce")
+    # Convert timestamp to numeric; invalid parsing becomes NaN.
+    # In clean logs the parser already produced numbers, so skip the (slow) generic
+    # conversion and only fall back to it when the column contains text.
+    ts = df["timestamp"].to_numpy()
+    if ts.dtype.kind in "fiu":
+        ts = ts.astype(np.float64, copy=False)
+    else:
+        ts = pd.to_numeric(df["timestamp"], errors="coerce").to_numpy(dtype=np.float64)
 
     # Drop any rows without a valid timestamp
-    df = df.dropna(subset=["timestamp"]).reset_index(drop=True)
+    valid = np.isfinite(ts)
+    if not valid.all():
+        df = df.iloc[valid].reset_index(drop=True)
+        ts = ts[valid]
 
     # Optional manual timestamp scaling fix (see FIX_TIMESTAMP_SCALE near the top of the file)
     if FIX_TIMESTAMP_SCALE:
-        df["timestamp"] = df["timestamp"] * TIMESTAMP_SCALE
+        ts = ts * TIMESTAMP_SCALE
+
+    df["timestamp"] = ts
 
     return df
 
@@ -240,6 +494,49 @@ def resolve_columns(df: pd.DataFrame) -> dict[str, str]:
     return mapping
 
 
+# -----------------------------------------------------------------------------
+# Plot helpers
+# -----------------------------------------------------------------------------
+def decimate_for_display(
+    t: np.ndarray, y: np.ndarray, i0: int = 0, i1: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a long series to a min/max envelope for drawing.
+
+    Only samples i0:i1 are used (main() passes the visible range after a zoom/pan).
+    If that range has DECIMATE_THRESHOLD samples or fewer, it is returned unchanged.
+
+    Otherwise the samples are split into DECIMATE_BINS equal bins and each bin is
+    replaced by its min and its max sample, in time order and at their real timestamps.
+    Unlike simply taking every Nth sample, this keeps short spikes visible, and every
+    drawn point is a real sample. The first and last samples of the range and the
+    samples left over after the last full bin are kept as-is.
+    """
+    if i1 is None:
+        i1 = len(t)
+    n = i1 - i0
+    if n <= DECIMATE_THRESHOLD:
+        return t[i0:i1], y[i0:i1]
+
+    bin_size = n // DECIMATE_BINS
+    n_binned = bin_size * DECIMATE_BINS
+    y_bins = y[i0:i0 + n_binned].reshape(DECIMATE_BINS, bin_size)
+
+    # Position of each bin's min and max. NaN never wins (a bin that is all NaN picks
+    # a NaN sample, i.e. a gap in the line).
+    is_nan = np.isnan(y_bins)
+    i_min = np.where(is_nan, np.inf, y_bins).argmin(axis=1)
+    i_max = np.where(is_nan, -np.inf, y_bins).argmax(axis=1)
+
+    bin_start = i0 + bin_size * np.arange(DECIMATE_BINS)
+    idx = np.empty(2 * DECIMATE_BINS, dtype=np.intp)
+    idx[0::2] = bin_start + np.minimum(i_min, i_max)
+    idx[1::2] = bin_start + np.maximum(i_min, i_max)
+    idx = np.concatenate([[i0], idx, np.arange(i0 + n_binned, i1), [i1 - 1]])
+
+    return t[idx], y[idx]
+
+
 # -----------------------------------------------------------------------------
 # Cursor helpers
 # -----------------------------------------------------------------------------
@@ -266,6 +563,69 @@ def nearest_index(x: float, x_arr: np.ndarray) -> int:
     return i if (x_arr[i] - x) < (x - x_arr[i - 1]) else (i - 1)
 
 
+if numba is not None:
+    # nearest_index() runs on every mouse move for logs that are not uniformly sampled.
+    # Compiled, the search + compare runs without any Python interpreter overhead.
+    nearest_index = numba.njit(cache=True)(nearest_index)
+
+
+def uniform_step(x_arr: np.ndarray) -> float | None:
+    """
+    Return the sample spacing of x_arr if it is uniformly sampled, otherwise None.
+
+    "Uniform" means every step between neighbouring samples is the same, allowing
+    for tiny floating point differences.
+    """
+    if len(x_arr) < 2:
+        return None
+
+    dt = (x_arr[-1] - x_arr[0]) / (len(x_arr) - 1)
+    if not dt > 0:
+        return None
+
+    if np.ptp(np.diff(x_arr)) < 1e-6 * dt:
+        return float(dt)
+    return None
+
+
+def nearest_index_uniform(x: float, x0: float, inv_dt: float, n: int) -> int:
+    """
+    Same as nearest_index(), but for uniformly sampled data (see uniform_step()).
+
+    The nearest index can be computed directly instead of searched for:
+        index = round((x - x0) / dt)
+
+    Args:
+        x0: First sample value (x_arr[0]).
+        inv_dt: 1 / sample spacing.
+        n: Number of samples.
+    """
+    i = int((x - x0) * inv_dt + 0.5)
+    return 0 if i < 0 else (n - 1 if i >= n else i)
+
+
+def label_formatter(name: str, scale: float = 1.0) -> Callable[[float], str]:
+    """
+    Build the function that turns a cursor value into its label text.
+
+    Example:
+        label_formatter("RPM")(3542.4) -> "RPM: 3542"
+
+    The format is chosen once per channel (see INTEGER_LABEL_CHANNELS), so the
+    mouse-move callback only has to call the returned function.
+
+    Args:
+        scale: Values are divided by this before display. Used for overlays that are
+            plotted scaled (GEAR on the RPM axis) but should be labelled unscaled.
+    """
+    fmt = f"{name}: {{:.0f}}" if name in INTEGER_LABEL_CHANNELS else f"{name}: {{:.2f}}"
+    if scale == 1.0:
+        return fmt.format
+
+    inv_scale = 1.0 / scale if scale != 0 else np.nan
+    return lambda v: fmt.format(v * inv_scale)
+
+
 # -----------------------------------------------------------------------------
 # Main plotting routine
 # -----------------------------------------------------------------------------
@@ -280,11 +640,53 @@ def main() -> None:
     df = read_jb4_csv(csv_path)
     colmap = resolve_columns(df)
 
-    # Convert timestamp to numpy array (faster operations in cursor callback)
-    t = df["timestamp"].to_numpy(dtype=float)
+    # Timestamp as a numpy array (faster operations in cursor callback).
+    # read_jb4_csv() already made it numeric. It stays float64: time math needs the precision.
+    t = df["timestamp"].to_numpy(dtype=np.float64)
+
+    # Convert every channel column we need to numeric in a single pass. Non-numeric becomes NaN.
+    #
+    # The result is one 2D array with one row per column (transposed so each row is
+    # contiguous in memory). The rows are ordered so the cursor can use slices of it
+    # directly, without copying:
+    #   data[:n_main]  one row per PLOTS entry (the main line of each subplot)
+    #   data[n_main:]  the overlay columns, in OVERLAY_COLUMNS order;
+    #                  data[overlay_row[name]] is the row for an overlay column
+    #
+    # Channel values (RPM, psi, AFR, ...) are stored as float32: plenty of precision for
+    # logged sensor data, at half the memory of float64.
+    plot_names = {friendly_name for friendly_name, _y_label, _y_lim in PLOTS}
+    main_cols = [colmap.get(friendly_name, friendly_name) for friendly_name, _y_label, _y_lim in PLOTS]
+    overlay_cols = [
+        col
+        for friendly_name, overlay in OVERLAY_COLUMNS.items() if friendly_name in plot_names
+        for col in overlay
+    ]
+    n_main = len(main_cols)
+
+    values = df[main_cols + overlay_cols].apply(pd.to_numeric, errors="coerce")
+    if "GEAR" in overlay_cols:
+        # GEAR is drawn scaled on the RPM subplot (see GEAR_SCALE). Scale it here so the
+        # cursor can read the scaled values straight from data as well.
+        values["GEAR"] *= GEAR_SCALE
+    data = np.ascontiguousarray(values.to_numpy(dtype=np.float32).T)
+    overlay_row = {col: n_main + k for k, col in enumerate(overlay_cols)}
+
     if len(t) == 0:
         raise ValueError("No data rows found after parsing CSV.")
 
+    # Pick how the cursor snaps to the nearest sample. Most logs are sampled at a fixed
+    # rate, so the index can be computed directly; otherwise fall back to a search.
+    dt = uniform_step(t)
+    if dt is not None:
+        snap_index = partial(nearest_index_uniform, x0=float(t[0]), inv_dt=1.0 / dt, n=len(t))
+    else:
+        snap_index = partial(nearest_index, x_arr=t)
+
+    # Run it once now, so any one-time cost (numba compiling nearest_index) is paid
+    # while loading rather than on the first mouse move.
+    snap_index(float(t[0]))
+
     # Create stacked subplots sharing the same x-axis.
     # sharex=True is what "locks" x-zoom/pan together across all subplots.
     n = len(PLOTS)
@@ -295,9 +697,6 @@ def main() -> None:
     if n == 1:
         axes = [axes]
 
-    # We'll store each plotted y-series so the cursor can quickly grab y[idx].
-    y_series: list[np.ndarray] = []
-
     y_colors: list[str] = []
 
     # Store extra series for the Boost subplot (Boost2 and Target)
@@ -322,78 +721,85 @@ def main() -> None:
     speed_extra_colors: list[str] = []
     rpm_extra_colors: list[str] = []
 
+    # Every plotted line and its full-resolution data, so long logs can be re-decimated
+    # for the visible range after a zoom/pan (see redecimate_lines()).
+    plotted_lines: list[tuple[plt.Line2D, np.ndarray]] = []
+
+    def plot_series(ax, y: np.ndarray, **kwargs) -> plt.Line2D:
+        line = ax.plot(*decimate_for_display(t, y), **kwargs)[0]
+        plotted_lines.append((line, y))
+        return line
+
     # Plot each channel in its own subplot with its own y-limits.
     for ax_i, (ax, (friendly_name, y_label, y_lim)) in enumerate(zip(axes, PLOTS)):
         col = colmap.get(friendly_name, friendly_name)
 
-        # Convert data to numeric. Non-numeric becomes NaN.
-        y = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
-        y_series.append(y)
+        y = data[ax_i]
 
         # Special case: Boost plot gets two additional lines (Boost2 and Target)
         if friendly_name == "Boost":
             boost_ax_index = ax_i
 
             # Plot Boost, Boost2, Target with distinct line colors
-            line_boost = ax.plot(t, y, label="Boost", color="C0")[0]
+            line_boost = plot_series(ax, y, label="Boost", color="C0")
             y_colors.append(line_boost.get_color())
 
-            y_boost2 = pd.to_numeric(df["Boost2"], errors="coerce").to_numpy(dtype=float)
-            line_boost2 = ax.plot(t, y_boost2, label="Boost2", color="C1")[0]
+            y_boost2 = data[overlay_row["Boost2"]]
+            line_boost2 = plot_series(ax, y_boost2, label="Boost2", color="C1")
             boost_extra_series.append(("Boost2", y_boost2))
             boost_extra_colors.append(line_boost2.get_color())
 
-            y_target = pd.to_numeric(df["Target"], errors="coerce").to_numpy(dtype=float)
-            line_target = ax.plot(t, y_target, label="Target", color="C2")[0]
+            y_target = data[overlay_row["Target"]]
+            line_target = plot_series(ax, y_target, label="Target", color="C2")
             boost_extra_series.append(("Target", y_target))
             boost_extra_colors.append(line_target.get_color())
 
         elif friendly_name == "Pedal":
             pedal_ax_index = ax_i
 
-            line_pedal = ax.plot(t, y, label="Pedal", color="C0")[0]
+            line_pedal = plot_series(ax, y, label="Pedal", color="C0")
             y_colors.append(line_pedal.get_color())
 
-            y_throttle = pd.to_numeric(df["Throttle"], errors="coerce").to_numpy(dtype=float)
-            line_throttle = ax.plot(t, y_throttle, label="Throttle", color="C1")[0]
+            y_throttle = data[overlay_row["Throttle"]]
+            line_throttle = plot_series(ax, y_throttle, label="Throttle", color="C1")
             pedal_extra_series.append(("Throttle", y_throttle))
             pedal_extra_colors.append(line_throttle.get_color())
 
         elif friendly_name == "AFR":
             afr_ax_index = ax_i
 
-            line_afr = ax.plot(t, y, label="AFR", color="C0")[0]
+            line_afr = plot_series(ax, y, label="AFR", color="C0")
             y_colors.append(line_afr.get_color())
 
-            y_afr2 = pd.to_numeric(df["AFR2"], errors="coerce").to_numpy(dtype=float)
-            line_afr2 = ax.plot(t, y_afr2, label="AFR2", color="C1")[0]
+            y_afr2 = data[overlay_row["AFR2"]]
+            line_afr2 = plot_series(ax, y_afr2, label="AFR2", color="C1")
             afr_extra_series.append(("AFR2", y_afr2))
             afr_extra_colors.append(line_afr2.get_color())
 
         elif friendly_name == "Speed":
             speed_ax_index = ax_i
 
-            line_speed = ax.plot(t, y, label="Speed", color="C0")[0]
+            line_speed = plot_series(ax, y, label="Speed", color="C0")
             y_colors.append(line_speed.get_color())
 
-            y_gps_speed = pd.to_numeric(df["GPS Speed"], errors="coerce").to_numpy(dtype=float)
-            line_gps_speed = ax.plot(t, y_gps_speed, label="GPS Speed", color="C1")[0]
+            y_gps_speed = data[overlay_row["GPS Speed"]]
+            line_gps_speed = plot_series(ax, y_gps_speed, label="GPS Speed", color="C1")
             speed_extra_series.append(("GPS Speed", y_gps_speed))
             speed_extra_colors.append(line_gps_speed.get_color())
 
         elif friendly_name == "RPM":
             rpm_ax_index = ax_i
 
-            line_rpm = ax.plot(t, y, label="RPM", color="C0")[0]
+            line_rpm = plot_series(ax, y, label="RPM", color="C0")
             y_colors.append(line_rpm.get_color())
 
-            y_gear_scaled = pd.to_numeric(df["GEAR"], errors="coerce").to_numpy(dtype=float) * GEAR_SCALE
-            line_gear = ax.plot(t, y_gear_scaled, label=f"GEAR x{GEAR_SCALE:g}", color="C1")[0]
+            y_gear_scaled = data[overlay_row["GEAR"]]  # already scaled by GEAR_SCALE
+            line_gear = plot_series(ax, y_gear_scaled, label=f"GEAR x{GEAR_SCALE:g}", color="C1")
             rpm_extra_series.append(("GEAR", y_gear_scaled))
             rpm_extra_colors.append(line_gear.get_color())
 
         else:
-            line_main = ax.plot(t, y, label=friendly_name)[0]
+            line_main = plot_series(ax, y, label=friendly_name)
             y_colors.append(line_main.get_color())
 
         ax.set_ylabel(y_label)
@@ -408,17 +814,45 @@ def main() -> None:
     for ax in axes:
         ax.set_xlim(left=t[0])
 
+    # Long logs are drawn decimated (see decimate_for_display()). When the x-range
+    # changes, rebuild the drawn lines from the samples that are now visible, so
+    # zooming into a pull shows full detail instead of the whole-log envelope.
+    if len(t) > DECIMATE_THRESHOLD:
+        drawn_range = [(0, len(t))]
+
+        def redecimate_lines(ax) -> None:
+            x0, x1 = ax.get_xlim()
+            # One extra sample on each side so the lines run to the plot edges.
+            i0 = max(int(np.searchsorted(t, x0)) - 1, 0)
+            i1 = min(int(np.searchsorted(t, x1, side="right")) + 1, len(t))
+            # Shared x-axes report the same change once per subplot; only redo it once.
+            if (i0, i1) == drawn_range[0]:
+                return
+            drawn_range[0] = (i0, i1)
+            for line, y in plotted_lines:
+                line.set_data(*decimate_for_display(t, y, i0, i1))
+
+        for ax in axes:
+            ax.callbacks.connect("xlim_changed", redecimate_lines)
+
+    # One row per subplot's main line (a view of data, see above), so the cursor can
+    # fetch every value at a sample with a single lookup: y_stack[:, idx].
+    y_stack = data[:n_main]
 
     # -------------------------------------------------------------------------
     # Add interactive cursor: vertical line across all plots + point markers.
     # -------------------------------------------------------------------------
     # One vertical line per axis so the cursor appears in every subplot.
-    # Initially invisible until mouse moves inside plots.
-    vlines = [ax.axvline(t[0], linewidth=1.0, alpha=0.7, visible=False) for ax in axes]
+    #
+    # All cursor artists are created with animated=True. Animated artists are skipped by
+    # a normal fig.canvas.draw(), so the cached background never contains the cursor
+    # and we can "blit" it on top (see on_draw / blit_cursor below). They are only ever
+    # drawn by blit_cursor(), and only while the mouse is inside the data time range.
+    vlines = [ax.axvline(t[0], linewidth=1.0, alpha=0.7, animated=True) for ax in axes]
 
     # One marker per subplot (a small dot) at the nearest data sample.
     markers = [
-        ax.plot([], [], marker="o", markersize=4, linestyle="None", visible=False)[0]
+        ax.plot([], [], marker="o", markersize=4, linestyle="None", animated=True)[0]
         for ax in axes
     ]
 
@@ -432,7 +866,7 @@ def main() -> None:
             0.0,
             0.0,
             "",
-            visible=False,
+            animated=True,
             fontsize=9,
             ha="left",
             va="center",
@@ -448,7 +882,7 @@ def main() -> None:
         boost_ax = axes[boost_ax_index]
 
         boost_extra_markers = [
-            boost_ax.plot([], [], marker="o", markersize=4, linestyle="None", visible=False)[0]
+            boost_ax.plot([], [], marker="o", markersize=4, linestyle="None", animated=True)[0]
             for _name, _y in boost_extra_series
         ]
 
@@ -464,7 +898,7 @@ def main() -> None:
                 va="center",
                 fontsize=9,
                 bbox=dict(boxstyle="round,pad=0.2", alpha=0.7),
-                visible=False,
+                animated=True,
             )
             for _name, _y in boost_extra_series
         ]
@@ -475,7 +909,7 @@ def main() -> None:
         pedal_ax = axes[pedal_ax_index]
 
         pedal_extra_markers = [
-            pedal_ax.plot([], [], marker="o", markersize=4, linestyle="None", visible=False)[0]
+            pedal_ax.plot([], [], marker="o", markersize=4, linestyle="None", animated=True)[0]
             for _name, _y in pedal_extra_series
         ]
 
@@ -489,7 +923,7 @@ def main() -> None:
                 va="center",
                 fontsize=9,
                 bbox=dict(boxstyle="round,pad=0.2", alpha=0.7),
-                visible=False,
+                animated=True,
             )
             for _name, _y in pedal_extra_series
         ]
@@ -500,7 +934,7 @@ def main() -> None:
         afr_ax = axes[afr_ax_index]
 
         afr_extra_markers = [
-            afr_ax.plot([], [], marker="o", markersize=4, linestyle="None", visible=False)[0]
+            afr_ax.plot([], [], marker="o", markersize=4, linestyle="None", animated=True)[0]
             for _name, _y in afr_extra_series
         ]
 
@@ -514,7 +948,7 @@ def main() -> None:
                 va="center",
                 fontsize=9,
                 bbox=dict(boxstyle="round,pad=0.2", alpha=0.7),
-                visible=False,
+                animated=True,
             )
             for _name, _y in afr_extra_series
         ]
@@ -525,7 +959,7 @@ def main() -> None:
         speed_ax = axes[speed_ax_index]
 
         speed_extra_markers = [
-            speed_ax.plot([], [], marker="o", markersize=4, linestyle="None", visible=False)[0]
+            speed_ax.plot([], [], marker="o", markersize=4, linestyle="None", animated=True)[0]
             for _name, _y in speed_extra_series
         ]
 
@@ -539,7 +973,7 @@ def main() -> None:
                 va="center",
                 fontsize=9,
                 bbox=dict(boxstyle="round,pad=0.2", alpha=0.7),
-                visible=False,
+                animated=True,
             )
             for _name, _y in speed_extra_series
         ]
@@ -550,7 +984,7 @@ def main() -> None:
         rpm_ax = axes[rpm_ax_index]
 
         rpm_extra_markers = [
-            rpm_ax.plot([], [], marker="o", markersize=4, linestyle="None", visible=False)[0]
+            rpm_ax.plot([], [], marker="o", markersize=4, linestyle="None", animated=True)[0]
             for _name, _y in rpm_extra_series
         ]
 
@@ -564,7 +998,7 @@ def main() -> None:
                 va="center",
                 fontsize=9,
                 bbox=dict(boxstyle="round,pad=0.2", alpha=0.7),
-                visible=False,
+                animated=True,
             )
             for _name, _y in rpm_extra_series
         ]
@@ -572,7 +1006,7 @@ def main() -> None:
 
     # A small info readout in the bottom-left of the figure.
     # You can expand this later to show all channel values at the cursor.
-    info_text = fig.text(0.01, 0.01, "", ha="left", va="bottom")
+    info_text = fig.text(0.01, 0.01, "", ha="left", va="bottom", animated=True)
 
     def apply_label_color(text_obj, color: str) -> None:
         text_obj.set_color(color)
@@ -582,9 +1016,154 @@ def main() -> None:
             patch.set_facecolor(color)
             patch.set_alpha(0.25)
 
-    def on_move(event) -> None:
+    # Label colors never change, so set them once here rather than on every mouse move.
+    for labels, colors in (
+        (value_labels, y_colors),
+        (boost_extra_labels, boost_extra_colors),
+        (pedal_extra_labels, pedal_extra_colors),
+        (afr_extra_labels, afr_extra_colors),
+        (speed_extra_labels, speed_extra_colors),
+        (rpm_extra_labels, rpm_extra_colors),
+    ):
+        for lbl, c in zip(labels, colors):
+            apply_label_color(lbl, c)
+
+    # Reusable numpy buffers for the cursor position. Filling these in place and passing
+    # them to set_xdata()/set_ydata() avoids building new Python lists (which matplotlib
+    # then has to convert to arrays) for every artist on every mouse move.
+    # All markers share one x buffer since they all sit at the same timestamp.
+    cursor_x = np.empty(1)
+    vline_x = np.empty(2)
+    marker_y = [np.empty(1) for _ in markers]
+    boost_extra_marker_y = [np.empty(1) for _ in boost_extra_markers]
+    pedal_extra_marker_y = [np.empty(1) for _ in pedal_extra_markers]
+    afr_extra_marker_y = [np.empty(1) for _ in afr_extra_markers]
+    speed_extra_marker_y = [np.empty(1) for _ in speed_extra_markers]
+    rpm_extra_marker_y = [np.empty(1) for _ in rpm_extra_markers]
+
+    # Label formatters (see label_formatter()), one per marker, built once up front.
+    label_fmt = [label_formatter(friendly_name) for friendly_name, _y_label, _y_lim in PLOTS]
+    boost_extra_label_fmt = [label_formatter(name) for name, _y in boost_extra_series]
+    pedal_extra_label_fmt = [label_formatter(name) for name, _y in pedal_extra_series]
+    afr_extra_label_fmt = [label_formatter(name) for name, _y in afr_extra_series]
+    speed_extra_label_fmt = [label_formatter(name) for name, _y in speed_extra_series]
+    # For GEAR, show the original (unscaled) gear in the label for clarity
+    # while still plotting the scaled value on the RPM axis.
+    rpm_extra_label_fmt = [label_formatter(name, scale=GEAR_SCALE) for name, _y in rpm_extra_series]
+
+    # Flatten the overlay markers/labels of every subplot (Boost2, Target, Throttle, ...)
+    # into one list, so the mouse-move callback can update them all in a single loop.
+    # Each entry: (marker, marker y buffer, label, label formatter); the matching values
+    # are the rows of extra_stack. Listed in OVERLAY_COLUMNS order, the order of the
+    # overlay rows of data.
+    #
+    # The label offsets never change, so they are set once here.
+    extra_updates: list[tuple] = []
+    for series, extra_markers, extra_marker_y, extra_labels, extra_label_fmt, y_offsets_pts in (
+        (pedal_extra_series, pedal_extra_markers, pedal_extra_marker_y, pedal_extra_labels, pedal_extra_label_fmt, Y_OFFSETS_DEFAULT),
+        (rpm_extra_series, rpm_extra_markers, rpm_extra_marker_y, rpm_extra_labels, rpm_extra_label_fmt, Y_OFFSETS_DEFAULT),
+        (boost_extra_series, boost_extra_markers, boost_extra_marker_y, boost_extra_labels, boost_extra_label_fmt, Y_OFFSETS_BOOST),
+        (afr_extra_series, afr_extra_markers, afr_extra_marker_y, afr_extra_labels, afr_extra_label_fmt, Y_OFFSETS_DEFAULT),
+        (speed_extra_series, speed_extra_markers, speed_extra_marker_y, speed_extra_labels, speed_extra_label_fmt, Y_OFFSETS_DEFAULT),
+    ):
+        for j, ((_name, _y), mk, y_buf, lbl, fmt) in enumerate(
+            zip(series, extra_markers, extra_marker_y, extra_labels, extra_label_fmt)
+        ):
+            dy = y_offsets_pts[j] if j < len(y_offsets_pts) else (14 - 14 * j)
+            lbl.set_position((10, dy))  # (dx, dy) in offset points
+            extra_updates.append((mk, y_buf, lbl, fmt))
+
+    # The overlay values, one row per extra_updates entry (a view of data, see above).
+    extra_stack = data[n_main:]
+
+    # -------------------------------------------------------------------------
+    # Blitting setup
+    # -------------------------------------------------------------------------
+    # Redrawing the whole figure (6 subplots + every line) on each mouse move is slow.
+    # Instead we cache a snapshot ("background") of the figure without the cursor, and
+    # on each mouse move we only:
+    #   1) restore the cached background,
+    #   2) draw the cursor artists on top of it,
+    #   3) push ("blit") the result to the screen.
+    #
+    # We cache the whole figure rather than one rectangle per subplot: the value labels
+    # can extend past the edges of their subplot, and anything drawn outside a restored
+    # rectangle would be left behind as a "ghost" label on the next move.
+    #
+    # Markers are listed before labels so the labels are drawn on top.
+    cursor_artists = [
+        *vlines,
+        *markers,
+        *boost_extra_markers,
+        *pedal_extra_markers,
+        *afr_extra_markers,
+        *speed_extra_markers,
+        *rpm_extra_markers,
+        *value_labels,
+        *boost_extra_labels,
+        *pedal_extra_labels,
+        *afr_extra_labels,
+        *speed_extra_labels,
+        *rpm_extra_labels,
+        info_text,
+    ]
+
+    # What the cursor currently shows: sample index and x-axis limits (idx -1 == hidden).
+    # The cursor artists are only drawn while it is shown.
+    # Many mouse positions snap to the same sample; when nothing changed we skip the update.
+    # info_idx is the sample the info readout text was last formatted for.
+    cursor_state = {"idx": -1, "xlim": None, "info_idx": -1}
+
+    # Filled in by on_draw() after every full redraw.
+    blit_state = {"background": None}
+
+    def on_draw(_event) -> None:
         """
-        Mouse-move callback.
+        Full-redraw callback (initial draw, zoom/pan, window resize, ...).
+        Re-cache the background, then draw the cursor back on top (if shown).
+        """
+        blit_state["background"] = fig.canvas.copy_from_bbox(fig.bbox)
+        if cursor_state["idx"] >= 0:
+            for artist in cursor_artists:
+                fig.draw_artist(artist)
+
+    def blit_cursor() -> None:
+        """
+        Restore the cached background, draw the cursor on top (if shown) and blit.
+        When the cursor is hidden this just "erases" it.
+        """
+        if blit_state["background"] is None:
+            return
+        fig.canvas.restore_region(blit_state["background"])
+        if cursor_state["idx"] >= 0:
+            for artist in cursor_artists:
+                fig.draw_artist(artist)
+        fig.canvas.blit(fig.bbox)
+
+    def hide_cursor() -> None:
+        """
+        Hide every cursor artist (lines, markers, labels, info readout) in one go:
+        mark the cursor as hidden and blit the background without it.
+        """
+        if cursor_state["idx"] == -1:
+            return  # already hidden; nothing to repaint
+        cursor_state["idx"] = -1
+        blit_cursor()
+
+    # Current x-axis limits, kept up to date by matplotlib's "xlim_changed" callback so
+    # the mouse-move callback does not have to query them on every event.
+    # (All subplots share the x-axis; we listen on each in case only one reports changes.)
+    xlim_cache = [axes[0].get_xlim()]
+
+    def on_xlim_changed(ax) -> None:
+        xlim_cache[0] = ax.get_xlim()
+
+    for ax in axes:
+        ax.callbacks.connect("xlim_changed", on_xlim_changed)
+
+    def update_cursor(event) -> None:
+        """
+        Move the cursor to the mouse position of a (motion) event.
         event.xdata is the x-value in data coordinates (timestamp seconds) for the axis under the mouse.
         """
         # If mouse isn't over an axes, do nothing.
@@ -595,243 +1174,115 @@ def main() -> None:
 
         # If cursor moves outside the data time range, hide cursor artifacts.
         if x < t[0] or x > t[-1]:
-            for vl in vlines:
-                vl.set_visible(False)
-            for mk in markers:
-                mk.set_visible(False)
-            for lbl in value_labels:
-                lbl.set_visible(False)
-            for mk in boost_extra_markers:
-                mk.set_visible(False)
-            for lbl in boost_extra_labels:
-                lbl.set_visible(False)
-            for mk in pedal_extra_markers:
-                mk.set_visible(False)
-            for lbl in pedal_extra_labels:
-                lbl.set_visible(False)
-            for mk in afr_extra_markers:
-                mk.set_visible(False)
-            for lbl in afr_extra_labels:
-                lbl.set_visible(False)
-            for mk in speed_extra_markers:
-                mk.set_visible(False)
-            for lbl in speed_extra_labels:
-                lbl.set_visible(False)
-            for mk in rpm_extra_markers:
-                mk.set_visible(False)
-            for lbl in rpm_extra_labels:
-                lbl.set_visible(False)
-            info_text.set_text("")
-            fig.canvas.draw_idle()
+            hide_cursor()
             return
 
         # Snap cursor to nearest real timestamp sample
-        idx = nearest_index(x, t)
+        idx = snap_index(x)
+
+        # Same sample and same zoom as last time: the cursor would not change.
+        xlim = xlim_cache[0]
+        if idx == cursor_state["idx"] and xlim == cursor_state["xlim"]:
+            return
+        cursor_state["idx"] = idx
+        cursor_state["xlim"] = xlim
+
         x_snap = t[idx]
 
         # A small horizontal offset so the value label does not sit directly on the vertical line.
         # We scale this by the current x-axis span so it behaves reasonably at different zoom levels.
-        x0, x1 = axes[0].get_xlim()
+        x0, x1 = xlim
         x_offset = 0.01 * (x1 - x0)
 
+        cursor_x[0] = x_snap
+        vline_x[:] = x_snap
+
         # Move the vertical line in every subplot
         for vl in vlines:
-            vl.set_xdata([x_snap, x_snap])
-            vl.set_visible(True)
+            vl.set_xdata(vline_x)
 
         # Move each marker to the (time, value) point for that subplot,
         # and update the corresponding text label to display the Y-value.
-        for (mk, y, lbl, (friendly_name, _y_label, _y_lim), c) in zip(markers, y_series, value_labels, PLOTS, y_colors):
-            y_val = y[idx]
-
-            mk.set_data([x_snap], [y_val])
-            mk.set_visible(True)
+        for (mk, y_buf, y_val, lbl, fmt) in zip(markers, marker_y, y_stack[:, idx], value_labels, label_fmt):
+            y_buf[0] = y_val
+            mk.set_xdata(cursor_x)
+            mk.set_ydata(y_buf)
 
             # Update label text and location (slightly to the right of the cursor line)
-            # Use compact formatting:
-            # - Integers (like RPM) will display without decimals if they are close to ints
-            # - Otherwise, display with 2 decimals
-            if np.isfinite(y_val) and abs(y_val - round(y_val)) < 1e-9:
-                text = f"{friendly_name}: {int(round(y_val))}"
-            else:
-                text = f"{friendly_name}: {y_val:.2f}"
-
-            lbl.set_text(text)
+            lbl.set_text(fmt(y_val))
             lbl.set_position((x_snap + x_offset, y_val))
-            lbl.set_visible(True)
-            apply_label_color(lbl, c)
 
-        # Update Boost subplot extra markers/labels (Boost2 and Target)
-        if boost_ax_index is not None and boost_extra_series:
-            # Stack labels vertically (in screen space) so they remain readable even when
-            # the underlying y-values are very close.
-            #
-            # Offsets are in "points" (1/72 inch). Tune these if you want more/less spacing.
-            y_offsets_pts = [14, 0, -14]
-
-            for j, ((name, y_arr), mk, lbl, c) in enumerate(
-                zip(boost_extra_series, boost_extra_markers, boost_extra_labels, boost_extra_colors),
-                start=0,
-            ):
-                y_val = y_arr[idx]
-
-                mk.set_data([x_snap], [y_val])
-                mk.set_visible(True)
-
-                if np.isfinite(y_val) and abs(y_val - round(y_val)) < 1e-9:
-                    text = f"{name}: {int(round(y_val))}"
-                else:
-                    text = f"{name}: {y_val:.2f}"
-
-                lbl.set_text(text)
-                apply_label_color(lbl, c)
-                lbl.xy = (x_snap, y_val)
-                dy = y_offsets_pts[j] if j < len(y_offsets_pts) else (14 - 14 * j)
-                lbl.set_position((10, dy))  # (dx, dy) in offset points
-                lbl.set_visible(True)
-
-        if pedal_ax_index is not None and pedal_extra_series:
-            y_offsets_pts = [14]
-
-            for j, ((name, y_arr), mk, lbl, c) in enumerate(
-                zip(pedal_extra_series, pedal_extra_markers, pedal_extra_labels, pedal_extra_colors),
-                start=0,
-            ):
-                y_val = y_arr[idx]
-
-                mk.set_data([x_snap], [y_val])
-                mk.set_visible(True)
-
-                if np.isfinite(y_val) and abs(y_val - round(y_val)) < 1e-9:
-                    text = f"{name}: {int(round(y_val))}"
-                else:
-                    text = f"{name}: {y_val:.2f}"
-
-                lbl.set_text(text)
-                apply_label_color(lbl, c)
-                lbl.xy = (x_snap, y_val)
-                dy = y_offsets_pts[j] if j < len(y_offsets_pts) else (14 - 14 * j)
-                lbl.set_position((10, dy))  # (dx, dy) in offset points
-                lbl.set_visible(True)
-
-        if afr_ax_index is not None and afr_extra_series:
-            y_offsets_pts = [14]
-
-            for j, ((name, y_arr), mk, lbl, c) in enumerate(
-                zip(afr_extra_series, afr_extra_markers, afr_extra_labels, afr_extra_colors),
-                start=0,
-            ):
-                y_val = y_arr[idx]
-
-                mk.set_data([x_snap], [y_val])
-                mk.set_visible(True)
-
-                if np.isfinite(y_val) and abs(y_val - round(y_val)) < 1e-9:
-                    text = f"{name}: {int(round(y_val))}"
-                else:
-                    text = f"{name}: {y_val:.2f}"
-
-                lbl.set_text(text)
-                apply_label_color(lbl, c)
-                lbl.xy = (x_snap, y_val)
-                dy = y_offsets_pts[j] if j < len(y_offsets_pts) else (14 - 14 * j)
-                lbl.set_position((10, dy))  # (dx, dy) in offset points
-                lbl.set_visible(True)
-
-        if speed_ax_index is not None and speed_extra_series:
-            y_offsets_pts = [14]
-
-            for j, ((name, y_arr), mk, lbl, c) in enumerate(
-                zip(speed_extra_series, speed_extra_markers, speed_extra_labels, speed_extra_colors),
-                start=0,
-            ):
-                y_val = y_arr[idx]
-
-                mk.set_data([x_snap], [y_val])
-                mk.set_visible(True)
-
-                if np.isfinite(y_val) and abs(y_val - round(y_val)) < 1e-9:
-                    text = f"{name}: {int(round(y_val))}"
-                else:
-                    text = f"{name}: {y_val:.2f}"
-
-                lbl.set_text(text)
-                apply_label_color(lbl, c)
-                lbl.xy = (x_snap, y_val)
-                dy = y_offsets_pts[j] if j < len(y_offsets_pts) else (14 - 14 * j)
-                lbl.set_position((10, dy))  # (dx, dy) in offset points
-                lbl.set_visible(True)
-
-        if rpm_ax_index is not None and rpm_extra_series:
-            y_offsets_pts = [14]
-
-            for j, ((name, y_arr), mk, lbl, c) in enumerate(
-                zip(rpm_extra_series, rpm_extra_markers, rpm_extra_labels, rpm_extra_colors),
-                start=0,
-            ):
-                y_val = y_arr[idx]
-
-                mk.set_data([x_snap], [y_val])
-                mk.set_visible(True)
-
-                # For GEAR, show the original (unscaled) gear in the label for clarity
-                # while still plotting the scaled value on the RPM axis.
-                gear_unscaled = y_val / GEAR_SCALE if GEAR_SCALE != 0 else np.nan
-                if np.isfinite(gear_unscaled) and abs(gear_unscaled - round(gear_unscaled)) < 1e-9:
-                    text = f"{name}: {int(round(gear_unscaled))}"
-                else:
-                    text = f"{name}: {gear_unscaled:.2f}"
-
-                lbl.set_text(text)
-                apply_label_color(lbl, c)
-                lbl.xy = (x_snap, y_val)
-                dy = y_offsets_pts[j] if j < len(y_offsets_pts) else (14 - 14 * j)
-                lbl.set_position((10, dy))  # (dx, dy) in offset points
-                lbl.set_visible(True)
-
-
-        info_text.set_text(f"t = {x_snap:.2f} s   (index {idx})")
-        fig.canvas.draw_idle()  # request a redraw without blocking
+        # Update the overlay markers/labels (Boost2, Target, Throttle, ...).
+        # Their label offsets are fixed (see extra_updates), so only the anchor point moves.
+        for (mk, y_buf, lbl, fmt), y_val in zip(extra_updates, extra_stack[:, idx]):
+            y_buf[0] = y_val
+            mk.set_xdata(cursor_x)
+            mk.set_ydata(y_buf)
+
+            lbl.set_text(fmt(y_val))
+            lbl.xy = (x_snap, y_val)
+
+        # The readout only depends on the sample, so a zoom (or hiding and coming back to
+        # the same sample) keeps the existing text instead of formatting it again.
+        if idx != cursor_state["info_idx"]:
+            cursor_state["info_idx"] = idx
+            info_text.set_text(f"t = {x_snap:.2f} s   (index {idx})")
+
+        blit_cursor()  # only repaint the cursor, not the whole figure
+
+    # The GUI can deliver mouse-move events far faster than the screen refreshes.
+    # Rather than updating the cursor for every single event, we remember the most
+    # recent one and let a single-shot timer apply it at most once per ~16 ms (~60 Hz).
+    # matplotlib's timer works with any interactive backend (a QTimer under QtAgg).
+    last_event = [None]
+    motion_pending = [False]
+
+    def on_motion_timer() -> None:
+        motion_pending[0] = False
+        update_cursor(last_event[0])
+
+    motion_timer = fig.canvas.new_timer(interval=16)
+    motion_timer.single_shot = True
+    motion_timer.add_callback(on_motion_timer)
+
+    # Non-interactive backends (e.g. Agg) have no event loop to run the timer,
+    # so there we update the cursor straight away.
+    throttle_motion = type(motion_timer) is not TimerBase
+
+    def on_move(event) -> None:
+        """
+        Mouse-move callback.
+        Only stash the event here; the timer calls update_cursor() with the latest one.
+        """
+        last_event[0] = event
+        if not throttle_motion:
+            update_cursor(event)
+        elif not motion_pending[0]:
+            motion_pending[0] = True
+            motion_timer.start()
 
     def on_leave(_event) -> None:
         """
         When mouse leaves the figure window, hide cursor artifacts.
         """
-        for vl in vlines:
-            vl.set_visible(False)
-        for mk in markers:
-            mk.set_visible(False)
-        for lbl in value_labels:
-            lbl.set_visible(False)
-        for mk in boost_extra_markers:
-            mk.set_visible(False)
-        for lbl in boost_extra_labels:
-            lbl.set_visible(False)
-        for mk in pedal_extra_markers:
-            mk.set_visible(False)
-        for lbl in pedal_extra_labels:
-            lbl.set_visible(False)
-        for mk in afr_extra_markers:
-            mk.set_visible(False)
-        for lbl in afr_extra_labels:
-            lbl.set_visible(False)
-        for mk in speed_extra_markers:
-            mk.set_visible(False)
-        for lbl in speed_extra_labels:
-            lbl.set_visible(False)
-        for mk in rpm_extra_markers:
-            mk.set_visible(False)
-        for lbl in rpm_extra_labels:
-            lbl.set_visible(False)
-        info_text.set_text("")
-        fig.canvas.draw_idle()
+        # Drop any pending update so the cursor does not reappear after we hide it.
+        motion_timer.stop()
+        motion_pending[0] = False
+        hide_cursor()
+
+    # Refresh the cached background whenever the figure is fully redrawn
+    # (zoom/pan, window resize, ...).
+    fig.canvas.mpl_connect("draw_event", on_draw)
+
+    # Lay out the figure and force one full draw so the background exists
+    # before the first mouse move.
+    plt.tight_layout()
+    fig.canvas.draw()
 
     # Connect callbacks to matplotlib's event system
     fig.canvas.mpl_connect("motion_notify_event", on_move)
     fig.canvas.mpl_connect("figure_leave_event", on_leave)
 
-    # Layout and show
-    plt.tight_layout()
     plt.show()
 
 